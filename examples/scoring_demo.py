@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+scoring_demo.py - Sample scenarios for the Veritas Reputation Scoring (VRS) module
+
+Walks through a few scoring scenarios with src/scoring.py and then runs its
+doctests. Run from the repository root:
+
+    python examples/scoring_demo.py
+"""
+
+import doctest
+import os
+import sys
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(_REPO_ROOT, "src"))
+
+import scoring  # noqa: E402
+from scoring import (  # noqa: E402
+    calculate_VRS,
+    calculate_VRS_from_raw,
+    compute_C,
+    compute_S,
+    compute_T,
+    format_VRS,
+    make_weights,
+)
+
+
+def main():
+    print("=" * 70)
+    print("Veritas Reputation Scoring (VRS) - Sample Scenarios")
+    print("=" * 70)
+
+    # Scenario 1: High-quality, recent news from reputable source
+    print("\n[Scenario 1] High-quality recent news from reputable source")
+    print("-" * 70)
+    S1 = compute_S(credibility_score=0.9, source_reputation=0.95, verification_count=8)
+    C1 = compute_C(accuracy=0.92, completeness=0.88, bias_score=0.05)
+    T1 = compute_T(age_days=1, update_frequency=3, relevance_decay=0.05)
+    VRS1 = calculate_VRS(S1, C1, T1)
+    print(f"  Source Score (S): {S1:.2f}")
+    print(f"  Content Score (C): {C1:.2f}")
+    print(f"  Temporal Score (T): {T1:.2f}")
+    print(f"  → VRS: {format_VRS(VRS1)}")
+
+    # Scenario 2: Moderate quality, older content from less established source
+    print("\n[Scenario 2] Moderate quality, older content from less established source")
+    print("-" * 70)
+    S2 = compute_S(credibility_score=0.6, source_reputation=0.55, verification_count=2)
+    C2 = compute_C(accuracy=0.65, completeness=0.70, bias_score=0.15)
+    T2 = compute_T(age_days=15, update_frequency=0, relevance_decay=0.05)
+    VRS2 = calculate_VRS(S2, C2, T2)
+    print(f"  Source Score (S): {S2:.2f}")
+    print(f"  Content Score (C): {C2:.2f}")
+    print(f"  Temporal Score (T): {T2:.2f}")
+    print(f"  → VRS: {format_VRS(VRS2)}")
+
+    # Scenario 3: Using convenience function with custom weights
+    print("\n[Scenario 3] Using convenience function with custom weights")
+    print("-" * 70)
+    VRS3 = calculate_VRS_from_raw(
+        credibility_score=0.75,
+        source_reputation=0.80,
+        verification_count=4,
+        accuracy=0.85,
+        completeness=0.80,
+        bias_score=0.10,
+        age_days=5,
+        update_frequency=1,
+        relevance_decay=0.05,
+        weights=make_weights(
+            w1=0.5,  # Give more weight to source
+            w2=0.3,  # Less weight to content
+            w3=0.2   # Same weight to temporal
+        )
+    )
+    print("  Using custom weights (w1=0.5, w2=0.3, w3=0.2)")
+    print(f"  → VRS: {format_VRS(VRS3)}")
+
+    print("\n" + "=" * 70)
+    print("Running doctests...")
+    print("=" * 70)
+
+    results = doctest.testmod(scoring, verbose=True)
+    print(f"\nDoctest Summary: {results.attempted} tests, {results.failed} failures")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
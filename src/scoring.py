@@ -1,4 +1,3 @@
-#!/usr/bin/env python3
 """
 scoring.py - Veritas Reputation Scoring (VRS) Module
 
@@ -9,12 +8,61 @@ Description: Implements the VRS formula for computing reputation scores
 
 VRS Formula: VRS = (w1*S) + (w2*C) + (w3*T)
 Default weights: w1=0.4, w2=0.4, w3=0.2
+
+Sample scenarios live in examples/scoring_demo.py. Run the doctests with:
+
+    python -m pytest --doctest-modules src/scoring.py
 """
 
+import functools
+import hashlib
+import inspect
+import os
+import struct
+import threading
+from collections import namedtuple
+
+import numpy as np
+
+try:
+    import numba
+    _NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional; batches fall back to the NumPy path
+    _NUMBA_AVAILABLE = False
+
+try:
+    import scoring_ext as _scoring_ext  # built from scoring_ext.c
+    _AVX2_AVAILABLE = True
+except ImportError:  # native kernel is optional; batches fall back to the NumPy path
+    _AVX2_AVAILABLE = False
+
 # ============================================================================
 # COMPONENT SCORE FUNCTIONS
 # ============================================================================
 
+# Formula constants shared by the scalar, NumPy and Numba paths
+_HALF = 0.5      # mean of two ratings, as a multiply rather than "/ 2"
+_K002 = 0.02     # verification bonus per verification
+_CAP01 = 0.1     # verification bonus cap
+_K005 = 0.05     # update bonus per recent update
+_CAP015 = 0.15   # update bonus cap
+
+# The capped bonuses min(count * rate, cap) take only a handful of values
+# (verifications stop counting after 5, updates after 3), so they are
+# tabulated by count for the scalar functions. Entries use the same
+# expression as the formula, so the table and the arithmetic fallback (used
+# for negative or non-int counts) agree exactly. The array paths keep the
+# arithmetic: a gather is slower than a multiply and a minimum.
+_VERIF_BONUS = tuple(
+    min(k * _K002, _CAP01) for k in range(int(round(_CAP01 / _K002)) + 1)
+)
+_UPDATE_BONUS = tuple(
+    min(k * _K005, _CAP015) for k in range(int(round(_CAP015 / _K005)) + 1)
+)
+_VERIF_BONUS_MAX = len(_VERIF_BONUS) - 1
+_UPDATE_BONUS_MAX = len(_UPDATE_BONUS) - 1
+
+
 def compute_S(credibility_score, source_reputation, verification_count=0):
     """
     Compute Source credibility score (S).
@@ -33,17 +81,31 @@ def compute_S(credibility_score, source_reputation, verification_count=0):
     float : Source credibility score normalized to [0, 1]
     
     Examples:
-    >>> compute_S(0.8, 0.9, 5)
-    0.88
-    >>> compute_S(0.5, 0.6, 0)
-    0.55
-    >>> compute_S(1.0, 1.0, 10)
-    1.0
+    >>> format_VRS(compute_S(0.8, 0.9, 5))
+    '0.95'
+    >>> format_VRS(compute_S(0.5, 0.6, 0))
+    '0.55'
+    >>> format_VRS(compute_S(1.0, 1.0, 10))
+    '1.00'
+    >>> compute_S(float("nan"), 0.6)  # missing data is not a top score
+    nan
     """
     # Combine credibility and reputation with verification bonus
-    base_score = (credibility_score + source_reputation) / 2
-    verification_bonus = min(verification_count * 0.02, 0.1)  # Cap at 0.1
-    return min(base_score + verification_bonus, 1.0)
+    # Clamps are inline conditionals rather than min()/max() calls: same
+    # result without a builtin call per clamp. The comparison is written so
+    # that NaN fails it and propagates, as it does through min()/max().
+    base_score = (credibility_score + source_reputation) * _HALF
+    if type(verification_count) is int and verification_count >= 0:
+        verification_bonus = _VERIF_BONUS[
+            verification_count if verification_count < _VERIF_BONUS_MAX
+            else _VERIF_BONUS_MAX
+        ]
+    else:
+        verification_bonus = verification_count * _K002
+        verification_bonus = (_CAP01 if verification_bonus > _CAP01
+                              else verification_bonus)
+    score = base_score + verification_bonus
+    return 1.0 if score > 1.0 else score
 
 
 def compute_C(accuracy, completeness, bias_score=0.0):
@@ -64,16 +126,17 @@ def compute_C(accuracy, completeness, bias_score=0.0):
     float : Content quality score normalized to [0, 1]
     
     Examples:
-    >>> compute_C(0.9, 0.8, 0.1)
-    0.76
-    >>> compute_C(0.7, 0.6, 0.0)
-    0.65
-    >>> compute_C(1.0, 1.0, 0.2)
-    0.8
+    >>> format_VRS(compute_C(0.9, 0.8, 0.1))
+    '0.75'
+    >>> format_VRS(compute_C(0.7, 0.6, 0.0))
+    '0.65'
+    >>> format_VRS(compute_C(1.0, 1.0, 0.2))
+    '0.80'
     """
     # Combine accuracy and completeness, then apply bias penalty
-    base_score = (accuracy + completeness) / 2
-    return max(base_score - bias_score, 0.0)
+    base_score = (accuracy + completeness) * _HALF
+    score = base_score - bias_score
+    return 0.0 if score < 0.0 else score
 
 
 def compute_T(age_days, update_frequency=0, relevance_decay=0.05):
@@ -94,25 +157,92 @@ def compute_T(age_days, update_frequency=0, relevance_decay=0.05):
     float : Temporal relevance score normalized to [0, 1]
     
     Examples:
-    >>> compute_T(0, 0, 0.05)
-    1.0
-    >>> compute_T(10, 2, 0.05)
-    0.65
-    >>> compute_T(30, 0, 0.05)
-    0.0
+    >>> format_VRS(compute_T(0, 0, 0.05))
+    '1.00'
+    >>> format_VRS(compute_T(10, 2, 0.05))
+    '0.60'
+    >>> format_VRS(compute_T(30, 0, 0.05))
+    '0.00'
     """
     # Exponential decay based on age
-    base_score = max(1.0 - (age_days * relevance_decay), 0.0)
+    base_score = 1.0 - (age_days * relevance_decay)
+    base_score = 0.0 if base_score < 0.0 else base_score
     # Bonus for recent updates
-    update_bonus = min(update_frequency * 0.05, 0.15)  # Cap at 0.15
-    return min(base_score + update_bonus, 1.0)
+    if type(update_frequency) is int and update_frequency >= 0:
+        update_bonus = _UPDATE_BONUS[
+            update_frequency if update_frequency < _UPDATE_BONUS_MAX
+            else _UPDATE_BONUS_MAX
+        ]
+    else:
+        update_bonus = update_frequency * _K005
+        update_bonus = _CAP015 if update_bonus > _CAP015 else update_bonus
+    score = base_score + update_bonus
+    return 1.0 if score > 1.0 else score
+
+
+# ============================================================================
+# WEIGHTS
+# ============================================================================
+
+_Weights = namedtuple("_Weights", ["w1", "w2", "w3"])
+
+
+def _validate_weights(w1, w2, w3):
+    """Raise ValueError unless the weights sum to approximately 1.0."""
+    total = w1 + w2 + w3
+    if abs(total - 1.0) > 0.01:
+        # Message is only formatted on the failure path
+        raise ValueError(f"Weights must sum to 1.0 (got {total})")
+
+
+def make_weights(w1=0.4, w2=0.4, w3=0.2):
+    """
+    Build a validated set of VRS weights.
+    
+    Weights are checked here, once, so that the scoring functions can use
+    them without re-validating on every call.
+    
+    Parameters:
+    -----------
+    w1 : float, optional
+        Weight for Source credibility (default: 0.4)
+    w2 : float, optional
+        Weight for Content quality (default: 0.4)
+    w3 : float, optional
+        Weight for Temporal relevance (default: 0.2)
+    
+    Returns:
+    --------
+    _Weights : immutable (w1, w2, w3) tuple
+    
+    Examples:
+    >>> make_weights(0.5, 0.3, 0.2)
+    _Weights(w1=0.5, w2=0.3, w3=0.2)
+    >>> make_weights(0.5, 0.5, 0.5)
+    Traceback (most recent call last):
+        ...
+    ValueError: Weights must sum to 1.0 (got 1.5)
+    """
+    _validate_weights(w1, w2, w3)
+    return _Weights(w1, w2, w3)
+
+
+DEFAULT_WEIGHTS = make_weights()
+
+# calculate_VRS specialized for DEFAULT_WEIGHTS, generated so the weights
+# are inlined as float literals instead of being unpacked on every call.
+exec(
+    "def _calculate_VRS_default(S, C, T):\n"
+    "    return ({!r} * S) + ({!r} * C) + ({!r} * T)\n".format(*DEFAULT_WEIGHTS),
+    globals(),
+)
 
 
 # ============================================================================
 # VRS MAIN FUNCTION
 # ============================================================================
 
-def calculate_VRS(S, C, T, w1=0.4, w2=0.4, w3=0.2):
+def calculate_VRS(S, C, T, weights=DEFAULT_WEIGHTS, validate=False):
     """
     Calculate the Veritas Reputation Score (VRS).
     
@@ -124,38 +254,40 @@ def calculate_VRS(S, C, T, w1=0.4, w2=0.4, w3=0.2):
         Content quality score (0.0 to 1.0)
     T : float
         Temporal relevance score (0.0 to 1.0)
-    w1 : float, optional
-        Weight for Source credibility (default: 0.4)
-    w2 : float, optional
-        Weight for Content quality (default: 0.4)
-    w3 : float, optional
-        Weight for Temporal relevance (default: 0.2)
+    weights : _Weights, optional
+        Weights for S, C, T as returned by `make_weights`
+        (default: DEFAULT_WEIGHTS, i.e. 0.4, 0.4, 0.2)
+    validate : bool, optional
+        Check that `weights` sum to 1.0 (default: False). Only needed for
+        weights that did not come from `make_weights`, which validates
+        them at configuration time.
     
     Returns:
     --------
     float : VRS score normalized to [0, 1]
     
     Examples:
-    >>> calculate_VRS(0.8, 0.7, 0.9)
-    0.78
-    >>> calculate_VRS(0.5, 0.6, 0.4)
-    0.52
-    >>> calculate_VRS(1.0, 1.0, 1.0, 0.33, 0.33, 0.34)
-    1.0
+    >>> format_VRS(calculate_VRS(0.8, 0.7, 0.9))
+    '0.78'
+    >>> format_VRS(calculate_VRS(0.5, 0.6, 0.4))
+    '0.52'
+    >>> format_VRS(calculate_VRS(1.0, 1.0, 1.0, make_weights(0.33, 0.33, 0.34)))
+    '1.00'
+    >>> calculate_VRS(1.0, 1.0, 1.0, (0.5, 0.5, 0.5), validate=True)
+    Traceback (most recent call last):
+        ...
+    ValueError: Weights must sum to 1.0 (got 1.5)
     """
-    # Validate weights sum to approximately 1.0
-    if abs((w1 + w2 + w3) - 1.0) > 0.01:
-        raise ValueError(f"Weights must sum to 1.0 (got {w1 + w2 + w3})")
-    
-    # Calculate weighted score
-    vrs = (w1 * S) + (w2 * C) + (w3 * T)
-    return round(vrs, 2)
+    w1, w2, w3 = weights
+    if validate:
+        _validate_weights(w1, w2, w3)
+    return (w1 * S) + (w2 * C) + (w3 * T)
 
 
 def calculate_VRS_from_raw(credibility_score, source_reputation, verification_count,
                            accuracy, completeness, bias_score,
                            age_days, update_frequency, relevance_decay=0.05,
-                           w1=0.4, w2=0.4, w3=0.2):
+                           weights=DEFAULT_WEIGHTS):
     """
     Calculate VRS directly from raw input parameters.
     
@@ -181,83 +313,732 @@ def calculate_VRS_from_raw(credibility_score, source_reputation, verification_co
         Number of updates in recent period
     relevance_decay : float, optional
         Decay rate per day (default: 0.05)
-    w1, w2, w3 : float, optional
-        Weights for S, C, T respectively (defaults: 0.4, 0.4, 0.2)
+    weights : _Weights, optional
+        Weights for S, C, T as returned by `make_weights` (default: DEFAULT_WEIGHTS)
     
     Returns:
     --------
     float : VRS score normalized to [0, 1]
     
     Examples:
-    >>> calculate_VRS_from_raw(0.8, 0.9, 5, 0.9, 0.8, 0.1, 0, 0)
-    0.79
-    >>> calculate_VRS_from_raw(0.5, 0.6, 0, 0.7, 0.6, 0.0, 10, 2)
-    0.6
+    >>> format_VRS(calculate_VRS_from_raw(0.8, 0.9, 5, 0.9, 0.8, 0.1, 0, 0))
+    '0.88'
+    >>> format_VRS(calculate_VRS_from_raw(0.5, 0.6, 0, 0.7, 0.6, 0.0, 10, 2))
+    '0.60'
     """
     S = compute_S(credibility_score, source_reputation, verification_count)
     C = compute_C(accuracy, completeness, bias_score)
     T = compute_T(age_days, update_frequency, relevance_decay)
-    return calculate_VRS(S, C, T, w1, w2, w3)
+    if weights is DEFAULT_WEIGHTS:
+        return _calculate_VRS_default(S, C, T)  # noqa: F821 (defined via exec)
+    return calculate_VRS(S, C, T, weights)
+
+
+def format_VRS(vrs):
+    """
+    Format a VRS score for display, rounded to two decimals.
+    
+    Scores are computed unrounded; rounding is left to presentation.
+    
+    Examples:
+    >>> format_VRS(0.7800000000000001)
+    '0.78'
+    """
+    return f"{vrs:.2f}"
 
 
 # ============================================================================
-# SAMPLE SCENARIOS AND UNIT TESTS
+# BATCH INPUT LAYOUT
 # ============================================================================
 
-if __name__ == "__main__":
-    print("=" * 70)
-    print("Veritas Reputation Scoring (VRS) - Sample Scenarios")
-    print("=" * 70)
-    
-    # Scenario 1: High-quality, recent news from reputable source
-    print("\n[Scenario 1] High-quality recent news from reputable source")
-    print("-" * 70)
-    S1 = compute_S(credibility_score=0.9, source_reputation=0.95, verification_count=8)
-    C1 = compute_C(accuracy=0.92, completeness=0.88, bias_score=0.05)
-    T1 = compute_T(age_days=1, update_frequency=3, relevance_decay=0.05)
-    VRS1 = calculate_VRS(S1, C1, T1)
-    print(f"  Source Score (S): {S1:.2f}")
-    print(f"  Content Score (C): {C1:.2f}")
-    print(f"  Temporal Score (T): {T1:.2f}")
-    print(f"  → VRS: {VRS1:.2f}")
-    
-    # Scenario 2: Moderate quality, older content from less established source
-    print("\n[Scenario 2] Moderate quality, older content from less established source")
-    print("-" * 70)
-    S2 = compute_S(credibility_score=0.6, source_reputation=0.55, verification_count=2)
-    C2 = compute_C(accuracy=0.65, completeness=0.70, bias_score=0.15)
-    T2 = compute_T(age_days=15, update_frequency=0, relevance_decay=0.05)
-    VRS2 = calculate_VRS(S2, C2, T2)
-    print(f"  Source Score (S): {S2:.2f}")
-    print(f"  Content Score (C): {C2:.2f}")
-    print(f"  Temporal Score (T): {T2:.2f}")
-    print(f"  → VRS: {VRS2:.2f}")
-    
-    # Scenario 3: Using convenience function with custom weights
-    print("\n[Scenario 3] Using convenience function with custom weights")
-    print("-" * 70)
-    VRS3 = calculate_VRS_from_raw(
-        credibility_score=0.75,
-        source_reputation=0.80,
-        verification_count=4,
-        accuracy=0.85,
-        completeness=0.80,
-        bias_score=0.10,
-        age_days=5,
-        update_frequency=1,
-        relevance_decay=0.05,
-        w1=0.5,  # Give more weight to source
-        w2=0.3,  # Less weight to content
-        w3=0.2   # Same weight to temporal
+# Record layout of one raw VRS input row. The batched API consumes these as
+# a structure of arrays: eight parallel 1-D columns in this order, one entry
+# per record. Keep the columns as separate arrays; packing ints and floats
+# into one homogeneous 2-D array upcasts everything and costs bandwidth.
+VRSInputs = np.dtype([
+    ("credibility_score", "f4"),
+    ("source_reputation", "f4"),
+    ("verification_count", "i4"),
+    ("accuracy", "f4"),
+    ("completeness", "f4"),
+    ("bias_score", "f4"),
+    ("age_days", "f4"),
+    ("update_frequency", "i4"),
+])
+
+VRS_INPUT_FIELDS = VRSInputs.names
+
+
+def from_records(records):
+    """
+    Convert row-oriented records into the column layout of the batched API.
+    
+    This is an explicit, per-record Python conversion; call it once at the
+    ingest boundary rather than inside a scoring loop.
+    
+    Parameters:
+    -----------
+    records : sequence of dict
+        Records keyed by the field names in `VRS_INPUT_FIELDS`
+    
+    Returns:
+    --------
+    tuple of ndarray : one contiguous column per field, in `VRS_INPUT_FIELDS` order
+    
+    Examples:
+    >>> cols = from_records([
+    ...     {"credibility_score": 0.5, "source_reputation": 0.6,
+    ...      "verification_count": 0, "accuracy": 0.7, "completeness": 0.6,
+    ...      "bias_score": 0.0,
+    ...      "age_days": 30, "update_frequency": 0}])
+    >>> [c.dtype.name for c in cols[:3]]
+    ['float32', 'float32', 'int32']
+    """
+    count = len(records)
+    return tuple(
+        np.fromiter((record[name] for record in records),
+                    dtype=VRSInputs[name], count=count)
+        for name in VRS_INPUT_FIELDS
     )
-    print(f"  Using custom weights (w1=0.5, w2=0.3, w3=0.2)")
-    print(f"  → VRS: {VRS3:.2f}")
+
+
+def split_columns(table):
+    """
+    Split a packed batch into the eight contiguous columns of the batched API.
     
-    print("\n" + "=" * 70)
-    print("Running doctests...")
-    print("=" * 70)
+    Parameters:
+    -----------
+    table : ndarray
+        Either a structured array of dtype `VRSInputs`, or a 2-D ``(N, 8)``
+        array whose columns follow `VRS_INPUT_FIELDS` order
+    
+    Returns:
+    --------
+    tuple of ndarray : one contiguous column per field
+    
+    Examples:
+    >>> cols = split_columns(np.zeros((4, 8), dtype=np.float32))
+    >>> len(cols), cols[0].shape, cols[0].flags.c_contiguous
+    (8, (4,), True)
+    """
+    table = np.asarray(table)
+    if table.dtype.names is not None:
+        return tuple(np.ascontiguousarray(table[name]) for name in VRS_INPUT_FIELDS)
+    if table.ndim != 2 or table.shape[1] != len(VRS_INPUT_FIELDS):
+        raise ValueError(
+            f"Expected a structured array or an (N, {len(VRS_INPUT_FIELDS)}) array "
+            f"(got shape {table.shape})"
+        )
+    return tuple(np.ascontiguousarray(table[:, j]) for j in range(table.shape[1]))
+
+
+# ============================================================================
+# BATCHED (VECTORIZED) FUNCTIONS
+# ============================================================================
+
+def compute_S_vec(credibility_score, source_reputation, verification_count=0):
+    """
+    Compute Source credibility scores (S) for a batch of records.
+    
+    Array counterpart of `compute_S`: every argument may be a NumPy array
+    (or anything broadcastable to one) and the whole column is scored at once.
+    
+    Returns:
+    --------
+    ndarray : Source credibility scores normalized to [0, 1]
+    
+    Examples:
+    >>> compute_S_vec(np.array([0.5, 1.0]), np.array([0.6, 1.0]), np.array([0, 10]))
+    array([0.55, 1.  ])
+    """
+    base_score = (np.asarray(credibility_score) + source_reputation) * _HALF
+    verification_bonus = np.minimum(np.asarray(verification_count) * _K002, _CAP01)
+    return np.minimum(base_score + verification_bonus, 1.0)
+
+
+def compute_C_vec(accuracy, completeness, bias_score=0.0):
+    """
+    Compute Content quality scores (C) for a batch of records.
+    
+    Array counterpart of `compute_C`.
+    
+    Returns:
+    --------
+    ndarray : Content quality scores normalized to [0, 1]
+    
+    Examples:
+    >>> compute_C_vec(np.array([1.0, 0.2]), np.array([1.0, 0.2]), np.array([0.2, 0.5]))
+    array([0.8, 0. ])
+    """
+    base_score = (np.asarray(accuracy) + completeness) * _HALF
+    return np.maximum(base_score - bias_score, 0.0)
+
+
+# Temporal base score max(1 - age * 0.05, 0) for whole-day ages under the
+# default decay. Anything at or past 1/decay days scores 0, which bounds
+# the table at 21 entries. Only compute_T_vec uses it: the batch entry
+# points hold ages as float32, where checking for whole days would cost
+# more than the arithmetic the lookup saves.
+_T_LUT_DECAY = 0.05
+_T_LUT_005 = np.clip(
+    1.0 - np.arange(int(round(1 / _T_LUT_DECAY)) + 1) * _T_LUT_DECAY, 0.0, 1.0
+)
+
+
+def compute_T_vec(age_days, update_frequency=0, relevance_decay=0.05):
+    """
+    Compute Temporal relevance scores (T) for a batch of records.
+    
+    Array counterpart of `compute_T`. Non-negative integer ages under the
+    default decay are scored by a table lookup instead of arithmetic.
+    
+    Returns:
+    --------
+    ndarray : Temporal relevance scores normalized to [0, 1]
+    
+    Examples:
+    >>> compute_T_vec(np.array([0, 30]), np.array([0, 0]))
+    array([1., 0.])
+    
+    The decay may vary per record, and negative ages score as in `compute_T`:
+    
+    >>> compute_T_vec(np.array([1, 2]), 0, np.array([0.05, 0.1]))
+    array([0.95, 0.8 ])
+    >>> compute_T_vec(np.array([-5]), np.array([-2])), compute_T(-5, -2)
+    (array([1.]), 1.0)
+    """
+    age_days = np.asarray(age_days)
+    if (np.ndim(relevance_decay) == 0 and relevance_decay == _T_LUT_DECAY
+            and np.issubdtype(age_days.dtype, np.integer)
+            and not (age_days.size and age_days.min() < 0)):
+        # Ages past the end of the table all score 0, as its last entry does
+        base_score = np.take(_T_LUT_005, age_days, mode="clip")
+    else:
+        base_score = np.maximum(1.0 - age_days * relevance_decay, 0.0)
+    update_bonus = np.minimum(np.asarray(update_frequency) * _K005, _CAP015)
+    return np.minimum(base_score + update_bonus, 1.0)
+
+
+def _as_column(name, values):
+    """
+    Cast one input column to its `VRSInputs` dtype.
+    
+    Count columns are int32. Float counts (e.g. a pandas column holding
+    missing values) are only accepted when every entry is a finite whole
+    number, and wider counts only when every entry fits in int32; a plain
+    cast would truncate 2.7 to 2, turn NaN into INT_MIN and wrap 2**32 to 0.
+    """
+    values = np.asarray(values)
+    dtype = VRSInputs[name]
+    if dtype.kind == "i" and not np.can_cast(values.dtype, dtype):
+        if values.dtype.kind == "f":
+            if not np.all(np.isfinite(values) & (values == np.trunc(values))):
+                raise ValueError(f"{name} must hold finite whole numbers")
+        limits = np.iinfo(dtype)
+        if values.size and (values.min() < limits.min or values.max() > limits.max):
+            raise ValueError(f"{name} must fit in {dtype.name}")
+    return values.astype(dtype, copy=False)
+
+
+def calculate_VRS_from_raw_batch(credibility_score, source_reputation,
+                                 verification_count, accuracy, completeness, bias_score,
+                                 age_days, update_frequency, relevance_decay=0.05,
+                                 weights=DEFAULT_WEIGHTS, backend="numpy"):
+    """
+    Calculate VRS for a batch of records given as parallel NumPy columns.
+    
+    Takes the same parameters as `calculate_VRS_from_raw`, but each raw input
+    is an array with one entry per record, so no Python-level loop is needed.
+    Columns are passed in `VRS_INPUT_FIELDS` order; use `from_records` or
+    `split_columns` to get there from row-oriented data, e.g.
+    ``calculate_VRS_from_raw_batch(*split_columns(table))``.
+    
+    Parameters:
+    -----------
+    (same as `calculate_VRS_from_raw`, as 1-D arrays; verification_count
+    and update_frequency are cast to int32 and must hold whole numbers in
+    its range)
+    backend : str, optional
+        "numpy" (default) for the fused NumPy path, "numba" for the
+        parallel JIT kernel, or "avx2" for the native kernel built from
+        scoring_ext.c. "numba" and "avx2" fall back to "numpy" when numba
+        or the extension is not available.
+    
+    Thread safety:
+    --------------
+    The "numba" kernel always, and the "avx2" kernel for batches of 64 or
+    more records, run without holding the GIL, so a thread pool serving
+    concurrent requests scores in parallel. For "numba" this needs the TBB
+    or OpenMP threading layer: numba's fallback workqueue layer cannot run
+    two parallel kernels at once, so on it concurrent "numba" calls are
+    serialized. The scalar functions hold the GIL throughout; a single
+    record is too short to amortize releasing it.
+    
+    Returns:
+    --------
+    ndarray : unrounded float32 VRS scores normalized to [0, 1], one per record.
+        Callers that need rounded values for storage can apply
+        ``np.round(out, 2, out=out)``.
+    
+    Examples:
+    >>> calculate_VRS_from_raw_batch(
+    ...     np.array([0.5, 1.0]), np.array([0.6, 1.0]), np.array([0, 10]),
+    ...     np.array([0.7, 1.0]), np.array([0.6, 1.0]), np.array([0.0, 0.0]),
+    ...     np.array([30, 0]), np.array([0, 0])).round(2)
+    array([0.48, 1.  ], dtype=float32)
+    
+    Scalars broadcast across the batch; columns of different lengths or
+    more than one dimension, and count columns holding fractions, NaN or
+    values outside int32, are rejected:
+    
+    >>> calculate_VRS_from_raw_batch(
+    ...     np.array([0.5, 1.0]), np.array([0.6, 1.0]), 0,
+    ...     np.array([0.7, 1.0]), np.array([0.6, 1.0]), 0.0,
+    ...     np.array([30, 0]), 0, backend="numba").round(2)
+    array([0.48, 1.  ], dtype=float32)
+    >>> calculate_VRS_from_raw_batch(*[np.zeros(3)] * 7, np.zeros(2))
+    ... # doctest: +ELLIPSIS
+    Traceback (most recent call last):
+        ...
+    ValueError: shape mismatch: ...
+    >>> calculate_VRS_from_raw_batch(*[np.zeros(2)] * 2, np.array([1.0, np.nan]),
+    ...                              *[np.zeros(2)] * 5)
+    Traceback (most recent call last):
+        ...
+    ValueError: verification_count must hold finite whole numbers
+    >>> calculate_VRS_from_raw_batch(*[np.zeros(2)] * 2, np.array([1, 2**32]),
+    ...                              *[np.zeros(2)] * 5)
+    Traceback (most recent call last):
+        ...
+    ValueError: verification_count must fit in int32
+    >>> calculate_VRS_from_raw_batch(*[np.zeros((3, 1))] * 8)
+    Traceback (most recent call last):
+        ...
+    ValueError: Batch columns must be 1-D (got shape (3, 1))
+    """
+    if backend not in ("numpy", "numba", "avx2"):
+        raise ValueError(
+            f"Unknown backend {backend!r} (expected 'numpy', 'numba' or 'avx2')"
+        )
+    
+    # Scores only need ~2 decimals, so batches run in float32: half the
+    # memory traffic of float64 and twice the SIMD lanes.
+    columns = [
+        _as_column(name, x)
+        for name, x in zip(VRS_INPUT_FIELDS,
+                           (credibility_score, source_reputation, verification_count,
+                            accuracy, completeness, bias_score,
+                            age_days, update_frequency))
+    ]
+    # Expand scalar columns and reject length mismatches up front: the
+    # native kernels index every column by record and do no bounds checks.
+    columns = [np.ascontiguousarray(x) for x in np.broadcast_arrays(*columns)]
+    if columns[0].ndim != 1:
+        raise ValueError(f"Batch columns must be 1-D (got shape {columns[0].shape})")
+    out = np.empty(columns[0].shape, dtype=np.float32)
+    
+    if backend == "avx2" and _AVX2_AVAILABLE:
+        _scoring_ext.vrs_batch_f32(*columns, out, relevance_decay, *weights)
+    elif backend == "numba" and _NUMBA_AVAILABLE:
+        w1, w2, w3 = weights
+        _launch_numba(_vrs_numba, *columns, relevance_decay, w1, w2, w3, out)
+    else:
+        calculate_VRS_fused(*columns, relevance_decay, weights, out=out)
+    return out
+
+
+def calculate_VRS_fused(credibility_score, source_reputation, verification_count,
+                        accuracy, completeness, bias_score,
+                        age_days, update_frequency, relevance_decay=0.05,
+                        weights=DEFAULT_WEIGHTS, out=None):
+    """
+    Calculate unrounded VRS for a batch of records in a single fused pass.
+    
+    Evaluates
+    
+        w1 * min((cred + rep) * 0.5 + min(vcount * 0.02, 0.1), 1)
+      + w2 * max((acc + comp) * 0.5 - bias, 0)
+      + w3 * min(max(1 - age * decay, 0) + min(upd * 0.05, 0.15), 1)
+    
+    accumulating directly into `out` with two scratch buffers, instead of
+    materializing separate S, C and T arrays.
+    
+    Parameters:
+    -----------
+    (same as `calculate_VRS_from_raw`, as arrays)
+    out : ndarray, optional
+        Preallocated output buffer; a new float64 array is allocated if omitted
+    
+    Returns:
+    --------
+    ndarray : `out`, holding one VRS score per record
+    
+    Examples:
+    >>> calculate_VRS_fused(
+    ...     np.array([0.5]), np.array([0.6]), np.array([0]),
+    ...     np.array([0.7]), np.array([0.6]), np.array([0.0]),
+    ...     np.array([30]), np.array([0])).round(2)
+    array([0.48])
+    """
+    w1, w2, w3 = weights
+    if out is None:
+        out = np.empty(np.shape(credibility_score), dtype=np.float64)
+    tmp = np.empty_like(out)
+    tmp2 = np.empty_like(out)
+    
+    # Source credibility: w1 * S
+    np.add(credibility_score, source_reputation, out=out)
+    np.multiply(out, _HALF, out=out)
+    np.multiply(verification_count, _K002, out=tmp)
+    np.minimum(tmp, _CAP01, out=tmp)
+    np.add(out, tmp, out=out)
+    np.minimum(out, 1.0, out=out)
+    np.multiply(out, w1, out=out)
+    
+    # Content quality: + w2 * C
+    np.add(accuracy, completeness, out=tmp)
+    np.multiply(tmp, _HALF, out=tmp)
+    np.subtract(tmp, bias_score, out=tmp)
+    np.maximum(tmp, 0.0, out=tmp)
+    np.multiply(tmp, w2, out=tmp)
+    np.add(out, tmp, out=out)
+    
+    # Temporal relevance: + w3 * T
+    np.multiply(age_days, relevance_decay, out=tmp)
+    np.subtract(1.0, tmp, out=tmp)
+    np.maximum(tmp, 0.0, out=tmp)
+    np.multiply(update_frequency, _K005, out=tmp2)
+    np.minimum(tmp2, _CAP015, out=tmp2)
+    np.add(tmp, tmp2, out=tmp)
+    np.minimum(tmp, 1.0, out=tmp)
+    np.multiply(tmp, w3, out=tmp)
+    np.add(out, tmp, out=out)
+    return out
+
+
+if _NUMBA_AVAILABLE:
+    # The explicit signature compiles (or loads from the on-disk cache) at
+    # import, so the first real batch does not pay the JIT latency.
+    # nogil lets threads scoring separate batches run concurrently.
+    @numba.njit("f4[:](f4[:], f4[:], i4[:], f4[:], f4[:], f4[:], f4[:], i4[:], "
+                "f4, f4, f4, f4, f4[:])",
+                parallel=True, cache=True, fastmath=True, nogil=True)
+    def _vrs_numba(cred, rep, vcount, acc, comp, bias, age, upd, decay,
+                   w1, w2, w3, out):
+        """Per-record float32 VRS kernel; same formula as `calculate_VRS_fused`."""
+        # float32 constants keep the arithmetic from promoting to float64
+        zero, half, one = np.float32(0.0), np.float32(_HALF), np.float32(1.0)
+        k_verif, cap_verif = np.float32(_K002), np.float32(_CAP01)
+        k_update, cap_update = np.float32(_K005), np.float32(_CAP015)
+        for i in numba.prange(out.shape[0]):
+            S = min((cred[i] + rep[i]) * half
+                    + min(np.float32(vcount[i]) * k_verif, cap_verif), one)
+            C = max((acc[i] + comp[i]) * half - bias[i], zero)
+            T = min(max(one - age[i] * decay, zero)
+                    + min(np.float32(upd[i]) * k_update, cap_update), one)
+            out[i] = w1 * S + w2 * C + w3 * T
+        return out
+
+
+# numba's workqueue threading layer (its fallback when neither TBB nor
+# OpenMP is installed) aborts the process if two threads launch parallel
+# kernels at once. Launches are serialized until the first one reveals the
+# active layer, and from then on only if that layer is workqueue.
+_NUMBA_LAUNCH_LOCK = threading.Lock()
+_numba_launch_serialized = True
+
+
+def _launch_numba(kernel, *args):
+    """Run a parallel numba kernel, serializing launches when required."""
+    global _numba_launch_serialized
+    if not _numba_launch_serialized:
+        return kernel(*args)
+    with _NUMBA_LAUNCH_LOCK:
+        result = kernel(*args)
+        _numba_launch_serialized = numba.threading_layer() == "workqueue"
+    return result
+
+
+def _matches_numpy(backend):
+    """True if `backend` scores a random batch as the NumPy path does."""
+    rng = np.random.default_rng(0)
+    columns = (rng.random(1000), rng.random(1000), rng.integers(0, 10, 1000),
+               rng.random(1000), rng.random(1000), rng.random(1000) * 0.3,
+               rng.random(1000) * 40, rng.integers(0, 5, 1000))
+    reference = calculate_VRS_from_raw_batch(*columns)
+    result = calculate_VRS_from_raw_batch(*columns, backend=backend)
+    return bool(np.allclose(result, reference, rtol=0, atol=1e-6))
+
+
+# Every optional backend must agree with the NumPy path to float32 precision.
+# A backend that is not installed falls back to NumPy and would agree
+# trivially, so its check is marked +SKIP and reported as skipped.
+__test__ = {
+    f"{backend}_matches_numpy": (
+        f">>> _matches_numpy({backend!r})"
+        + ("" if available else "  # doctest: +SKIP")
+        + "\nTrue\n"
+    )
+    for backend, available in (("numba", _NUMBA_AVAILABLE), ("avx2", _AVX2_AVAILABLE))
+}
+
+
+# ============================================================================
+# DATAFRAME / ARROW INTEGRATION
+# ============================================================================
+
+def _table_columns(columns):
+    """Resolve the input-field -> table-column mapping for the table scorers."""
+    mapping = dict(zip(VRS_INPUT_FIELDS, VRS_INPUT_FIELDS))
+    if columns is not None:
+        unknown = set(columns) - set(VRS_INPUT_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown VRS input fields: {sorted(unknown)}")
+        mapping.update(columns)
+    return mapping
+
+
+def score_dataframe(df, columns=None, inplace=False, output="vrs",
+                    relevance_decay=0.05, weights=DEFAULT_WEIGHTS, backend="numpy"):
+    """
+    Score every row of a pandas DataFrame and store the VRS in a column.
+    
+    Input columns are extracted as NumPy arrays (without copying when their
+    dtype already matches `VRSInputs`) and scored in one call to
+    `calculate_VRS_from_raw_batch`.
+    
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+        Table holding the raw VRS inputs
+    columns : dict, optional
+        Maps field names in `VRS_INPUT_FIELDS` to column names in `df`;
+        fields not listed are read from the column of the same name
+    inplace : bool, optional
+        Write the result into `df` instead of a copy (default: False)
+    output : str, optional
+        Name of the result column (default: "vrs")
+    relevance_decay, weights, backend : optional
+        Passed through to `calculate_VRS_from_raw_batch`
+    
+    Returns:
+    --------
+    pandas.DataFrame : `df` (or its copy) with the `output` column added
+    
+    Examples:
+    >>> import pandas as pd
+    >>> df = pd.DataFrame({
+    ...     "credibility_score": [0.5, 1.0], "source_reputation": [0.6, 1.0],
+    ...     "verifications": [0, 10], "accuracy": [0.7, 1.0],
+    ...     "completeness": [0.6, 1.0], "bias_score": [0.0, 0.0],
+    ...     "age_days": [30, 0], "update_frequency": [0, 0]})
+    >>> scored = score_dataframe(df, columns={"verification_count": "verifications"})
+    >>> [format_VRS(v) for v in scored["vrs"]], "vrs" in df
+    (['0.48', '1.00'], False)
+    >>> _ = score_dataframe(df, columns={"verification_count": "verifications"},
+    ...                     inplace=True, output="score")
+    >>> [format_VRS(v) for v in df["score"]]
+    ['0.48', '1.00']
+    """
+    mapping = _table_columns(columns)
+    # Native dtypes are kept here; calculate_VRS_from_raw_batch does the
+    # (checked) cast, which is a no-op for columns already in VRSInputs dtypes.
+    arrays = [df[mapping[name]].to_numpy() for name in VRS_INPUT_FIELDS]
+    out = calculate_VRS_from_raw_batch(*arrays, relevance_decay=relevance_decay,
+                                       weights=weights, backend=backend)
+    if not inplace:
+        df = df.copy()
+    df[output] = out
+    return df
+
+
+def score_arrow_table(table, columns=None, output="vrs",
+                      relevance_decay=0.05, weights=DEFAULT_WEIGHTS, backend="numpy"):
+    """
+    Score every row of a PyArrow Table and return it with a VRS column.
+    
+    Arrow tables are immutable, so a new table with the `output` column
+    appended is returned. Columns are read zero-copy where Arrow allows it
+    (single chunk, no nulls). Parameters are as for `score_dataframe`.
+    
+    Returns:
+    --------
+    pyarrow.Table : `table` with the `output` column appended
+    
+    Examples:
+    
+    Chunked columns are scored as one batch. A null in a score column
+    yields a NaN VRS for that row; a null in a count column is rejected.
+    
+    >>> import pyarrow as pa
+    >>> table = pa.table({
+    ...     "credibility_score": pa.chunked_array([[0.5], [1.0]]),
+    ...     "source_reputation": [0.6, 1.0], "verification_count": [0, 10],
+    ...     "accuracy": [0.7, 1.0], "completeness": [0.6, None],
+    ...     "bias_score": [0.0, 0.0], "age_days": [30, 0], "update_frequency": [0, 0]})
+    >>> table.column("credibility_score").num_chunks
+    2
+    >>> [format_VRS(v) for v in score_arrow_table(table).column("vrs").to_pylist()]
+    ['0.48', 'nan']
+    >>> with_null_count = table.set_column(
+    ...     2, "verification_count", pa.chunked_array([[0], [None]]))
+    >>> score_arrow_table(with_null_count)
+    Traceback (most recent call last):
+        ...
+    ValueError: verification_count must hold finite whole numbers
+    """
+    import pyarrow as pa  # only needed here; not a core dependency
+    
+    mapping = _table_columns(columns)
+    arrays = [table.column(mapping[name]).to_numpy() for name in VRS_INPUT_FIELDS]
+    out = calculate_VRS_from_raw_batch(*arrays, relevance_decay=relevance_decay,
+                                       weights=weights, backend=backend)
+    return table.append_column(output, pa.array(out))
+
+
+# ============================================================================
+# PERSISTENT CACHE
+# ============================================================================
+
+class _DiskCache:
+    """
+    Append-only file of fixed-size (key, score) records with an in-memory index.
+    
+    The whole file is indexed on open, so lookups never touch the disk.
+    Writes append one record each; a torn record at the end of the file
+    (e.g. from a crash mid-write) is truncated away when the file is next
+    loaded, so later appends stay record-aligned.
+    """
+    
+    _RECORD = struct.Struct("<16sd")
+    
+    def __init__(self, path):
+        self.path = path
+        self._index = {}
+        self._file = None
+        self._lock = threading.Lock()
+        self._load()
+    
+    def _load(self):
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return
+        usable = len(data) - len(data) % self._RECORD.size
+        if usable != len(data):
+            with open(self.path, "r+b") as f:
+                f.truncate(usable)
+        for key, value in self._RECORD.iter_unpack(data[:usable]):
+            self._index[key] = value
+    
+    def get(self, key):
+        return self._index.get(key)
+    
+    def put(self, key, value):
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "ab")
+            self._file.write(self._RECORD.pack(key, value))
+            self._file.flush()
+            self._index[key] = value
+    
+    def clear(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._index.clear()
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+
+def _input_key(args, version):
+    """16-byte digest of the numeric call arguments (weight tuples flattened)."""
+    values = []
+    for arg in args:
+        if isinstance(arg, tuple):
+            values.extend(arg)
+        else:
+            values.append(arg)
+    hasher = hashlib.blake2b(version.encode(), digest_size=16)
+    hasher.update(struct.pack(f"<{len(values)}d", *values))
+    return hasher.digest()
+
+
+def cached_to_disk(path=".vrs_cache", version=""):
+    """
+    Persist the results of a scalar scoring function across runs.
+    
+    Intended for `calculate_VRS_from_raw`, where the same articles are
+    re-scored by nightly batches and ad-hoc queries. Results are keyed by
+    all call arguments, defaults included, so a different relevance_decay
+    or set of weights never returns a stale score.
+    
+    Invalidation: bump `version` when the scoring formula itself changes,
+    or call the wrapper's `cache_clear()` to drop the file. Entries have
+    no TTL: age_days is part of the key, so a stored score never goes
+    stale on its own.
+    
+    Parameters:
+    -----------
+    path : str, optional
+        Cache file (default: ".vrs_cache")
+    version : str, optional
+        Tag mixed into every key (default: "")
+    
+    Returns:
+    --------
+    callable : decorator
+    
+    Examples:
+    >>> import tempfile
+    >>> tmpdir = tempfile.TemporaryDirectory()
+    >>> cache_path = os.path.join(tmpdir.name, "vrs_cache")
+    >>> cached_VRS = cached_to_disk(cache_path)(calculate_VRS_from_raw)
+    >>> format_VRS(cached_VRS(0.5, 0.6, 0, 0.7, 0.6, 0.0, 10, 2))
+    '0.60'
+    >>> cached_VRS.cache_clear()
+    
+    A record torn by a crash mid-write is dropped on the next open, and
+    records written afterwards are read back intact:
+    
+    >>> calls = []
+    >>> def score(x, weights=(0.5, 0.5)):
+    ...     calls.append(x)
+    ...     return x * 2
+    >>> cached_score = cached_to_disk(cache_path)(score)
+    >>> cached_score(0.25)
+    0.5
+    >>> with open(cache_path, "ab") as f:
+    ...     _ = f.write(b"torn")
+    >>> cached_score = cached_to_disk(cache_path)(score)
+    >>> cached_score(0.25), cached_score(0.75)
+    (0.5, 1.5)
+    >>> cached_score = cached_to_disk(cache_path)(score)
+    >>> cached_score(0.25), cached_score(0.75), calls
+    (0.5, 1.5, [0.25, 0.75])
+    >>> cached_score.cache_clear()
+    >>> tmpdir.cleanup()
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        cache = _DiskCache(path)
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = _input_key(bound.args, version)
+            value = cache.get(key)
+            if value is None:
+                value = func(*args, **kwargs)
+                cache.put(key, value)
+            return value
+        
+        wrapper.cache_clear = cache.clear
+        return wrapper
     
-    import doctest
-    results = doctest.testmod(verbose=True)
-    print(f"\nDoctest Summary: {results.attempted} tests, {results.failed} failures")
-    print("=" * 70)
+    return decorator